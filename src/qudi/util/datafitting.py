@@ -23,11 +23,16 @@ If not, see <https://www.gnu.org/licenses/>.
 __all__ = ('is_fit_model', 'get_all_fit_models', 'FitConfiguration', 'FitConfigurationsModel',
            'FitContainer')
 
+import collections.abc
+import copy
+import functools
+import hashlib
 import importlib
 import logging
-import inspect
+import operator
 import lmfit
 import numpy as np
+from types import MappingProxyType
 from PySide2 import QtCore
 from typing import Iterable, Optional, Mapping, Union
 
@@ -42,32 +47,127 @@ _log = logging.getLogger(__name__)
 
 
 def is_fit_model(cls):
-    return inspect.isclass(cls) and issubclass(cls, FitModelBase) and (cls is not FitModelBase)
+    return isinstance(cls, type) and issubclass(cls, FitModelBase) and (cls is not FitModelBase)
 
 
-# Upon import of this module the global attribute _fit_models is initialized with a dict
-# containing all importable fit model objects with names as keys.
-_fit_models = dict()
-for mod_finder in iter_modules_recursive(_fit_models_ns.__path__, _fit_models_ns.__name__ + '.'):
-    try:
-        _fit_models.update(
-            {name: cls for name, cls in
-             inspect.getmembers(importlib.import_module(mod_finder.name), is_fit_model)}
-        )
-    except:
-        _log.exception(
-            f'Exception while importing qudi.util.fit_models sub-module "{mod_finder.name}":'
-        )
+def _iter_fit_classes(mod):
+    """ Yields (name, class) tuples of all fit model classes in the namespace of module <mod>.
+    """
+    for name, obj in mod.__dict__.items():
+        if is_fit_model(obj):
+            yield name, obj
+
+
+class _LazyFitModels(collections.abc.Mapping):
+    """ Read-only mapping containing all importable fit model objects with names as keys.
+    The qudi.util.fit_models sub-modules are only imported upon first access of this mapping.
+    """
+
+    def __init__(self):
+        self._lock = Mutex()
+        self._models = None
+
+    def _load(self):
+        if self._models is None:
+            with self._lock:
+                if self._models is None:
+                    self._models = self._import_fit_models()
+        return self._models
+
+    @staticmethod
+    def _import_fit_models():
+        models = dict()
+        for mod_finder in iter_modules_recursive(_fit_models_ns.__path__,
+                                                 _fit_models_ns.__name__ + '.'):
+            try:
+                models.update(sorted(_iter_fit_classes(importlib.import_module(mod_finder.name))))
+            except:
+                _log.exception(
+                    f'Exception while importing qudi.util.fit_models sub-module "{mod_finder.name}":'
+                )
+        return models
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+    def copy(self):
+        return self._load().copy()
+
+
+_fit_models = _LazyFitModels()
 
 
 def get_all_fit_models():
     return _fit_models.copy()
 
 
+@functools.lru_cache(maxsize=None)
+def _get_model(name):
+    """ Returns a shared fit model instance for the given model name. Instances are created only
+    once per process.
+    """
+    return _fit_models[name]()
+
+
+@functools.lru_cache(maxsize=None)
+def _estimators_for(name):
+    """ Returns a tuple of all estimator names available for the given model name.
+    """
+    return tuple(_get_model(name).estimators)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_cached_default_params(name):
+    params = _get_model(name).make_params()
+    return lmfit.Parameters() if params is None else params
+
+
+def _get_default_params(name):
+    """ Returns a deep copy of the default parameters for the given model name. The returned
+    object can be safely mutated by the caller.
+    """
+    return copy.deepcopy(_get_cached_default_params(name))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_model_estimators():
+    """ Returns a read-only mapping of estimator names for all fit models. Estimator names are
+    static for each fit model, so this mapping is collected only once.
+    """
+    return MappingProxyType({name: _estimators_for(name) for name in _fit_models})
+
+
+class _DefaultParametersMapping(collections.abc.Mapping):
+    """ Read-only mapping of fit model names to their default parameters.
+    The default parameters of each model are created only once. Values are deep copies of these
+    cached defaults created upon access and can be safely mutated by the caller.
+    """
+
+    def __getitem__(self, key):
+        return _get_default_params(key)
+
+    def __iter__(self):
+        return iter(_fit_models)
+
+    def __len__(self):
+        return len(_fit_models)
+
+
+_model_default_parameters = _DefaultParametersMapping()
+
+
 class FitConfiguration:
     """
     """
 
+    __slots__ = ('_name', '_model', '_estimator', '_custom_parameters')
+
     def __init__(self, name: str, model: str, estimator: Optional[str] = None, custom_parameters: Optional[lmfit.Parameters] = None):
         assert isinstance(name, str), 'FitConfiguration name must be str type.'
         assert name, 'FitConfiguration name must be non-empty string.'
@@ -102,12 +202,11 @@ class FitConfiguration:
 
     @property
     def available_estimators(self):
-        return tuple(_fit_models[self._model]().estimators)
+        return _estimators_for(self._model)
 
     @property
     def default_parameters(self):
-        params = _fit_models[self._model]().make_params()
-        return lmfit.Parameters() if params is None else params
+        return _get_default_params(self._model)
 
     @property
     def custom_parameters(self):
@@ -123,6 +222,13 @@ class FitConfiguration:
                 'Property custom_parameters must be of type <lmfit.Parameters>.'
         self._custom_parameters = value.copy() if value is not None else None
 
+    @property
+    def _custom_parameters_shared(self):
+        """ Internal read-only access to custom parameters without copying. Do NOT mutate the
+        returned object.
+        """
+        return self._custom_parameters
+
     def to_dict(self):
         return {
             'name': self._name,
@@ -151,6 +257,19 @@ class FitConfigurationsModel(QtCore.QAbstractListModel):
         assert (configurations is None) or all(isinstance(c, FitConfiguration) for c in configurations)
         super().__init__(*args, **kwargs)
         self._fit_configurations = list() if configurations is None else list(configurations)
+        # Configuration names are held in a separate list with the same row order as
+        # _fit_configurations for fast access by views. _name_to_row maps names to row indices.
+        self._config_names = list()
+        self._name_to_row = dict()
+        self._names_cache = None
+        self._rebuild_name_index()
+
+    def _rebuild_name_index(self):
+        self._names_cache = None
+        self._config_names = [fc.name for fc in self._fit_configurations]
+        self._name_to_row = dict()
+        for row, name in enumerate(self._config_names):
+            self._name_to_row.setdefault(name, row)
 
     @property
     def model_names(self):
@@ -158,15 +277,17 @@ class FitConfigurationsModel(QtCore.QAbstractListModel):
 
     @property
     def model_estimators(self):
-        return {name: tuple(model().estimators) for name, model in _fit_models.items()}
+        return _get_model_estimators()
 
     @property
     def model_default_parameters(self):
-        return {name: model().make_params() for name, model in _fit_models.items()}
+        return _model_default_parameters
 
     @property
     def configuration_names(self):
-        return tuple(fc.name for fc in self._fit_configurations)
+        if self._names_cache is None:
+            self._names_cache = tuple(self._config_names)
+        return self._names_cache
 
     @property
     def configurations(self):
@@ -174,30 +295,34 @@ class FitConfigurationsModel(QtCore.QAbstractListModel):
 
     @QtCore.Slot(str, str)
     def add_configuration(self, name: str, model: str, estimator: Optional[str] = None, custom_parameters: Optional[lmfit.Parameters] = None):
-        assert name not in self.configuration_names, f'Fit config "{name}" already defined.'
+        assert name not in self._name_to_row, f'Fit config "{name}" already defined.'
         assert name != 'No Fit', '"No Fit" is a reserved name for fit configs. Choose another.'
         config = FitConfiguration(name, model, estimator, custom_parameters)
         new_row = len(self._fit_configurations)
         self.beginInsertRows(self.createIndex(new_row, 0), new_row, new_row)
         self._fit_configurations.append(config)
+        self._config_names.append(name)
+        self._name_to_row[name] = new_row
+        self._names_cache = None
         self.endInsertRows()
         self.sigFitConfigurationsChanged.emit(self.configuration_names)
 
     @QtCore.Slot(str)
     def remove_configuration(self, name):
         try:
-            row_index = self.configuration_names.index(name)
-        except ValueError:
+            row_index = self._name_to_row[name]
+        except KeyError:
             return
         self.beginRemoveRows(self.createIndex(row_index, 0), row_index, row_index)
         self._fit_configurations.pop(row_index)
+        self._rebuild_name_index()
         self.endRemoveRows()
         self.sigFitConfigurationsChanged.emit(self.configuration_names)
 
     def get_configuration_by_name(self, name):
         try:
-            row_index = self.configuration_names.index(name)
-        except ValueError:
+            row_index = self._name_to_row[name]
+        except KeyError:
             raise ValueError(f'No fit configuration found with name "{name}".')
         return self._fit_configurations[row_index]
 
@@ -214,7 +339,7 @@ class FitConfigurationsModel(QtCore.QAbstractListModel):
                 return 'Fit Configurations'
             elif orientation == QtCore.Qt.Vertical:
                 try:
-                    return self.configuration_names[section]
+                    return self._config_names[section]
                 except IndexError:
                     pass
         return None
@@ -232,16 +357,15 @@ class FitConfigurationsModel(QtCore.QAbstractListModel):
             config = index.data(QtCore.Qt.DisplayRole)
             if config is None:
                 return False
-            new_params = value[1]
-            params = config.default_parameters
-            for name in [p for p in params if p not in new_params]:
-                del params[name]
-            for name, p in params.items():
-                value_tuple = new_params[name]
-                p.set(vary=value_tuple[0],
-                      value=value_tuple[1],
-                      min=value_tuple[2],
-                      max=value_tuple[3])
+            # Build custom parameters from scratch. Parameter names are validated against the
+            # model default parameters by FitConfiguration.custom_parameters setter.
+            params = lmfit.Parameters()
+            for name, value_tuple in value[1].items():
+                params.add(name,
+                           vary=value_tuple[0],
+                           value=value_tuple[1],
+                           min=value_tuple[2],
+                           max=value_tuple[3])
             config.estimator = None if not value[0] else value[0]
             config.custom_parameters = None if not params else params
             self.dataChanged.emit(self.createIndex(index.row(), 0),
@@ -282,10 +406,44 @@ class FitConfigurationsModel(QtCore.QAbstractListModel):
                 _log.warning(f'Unable to load fit configuration:\n{cfg}')
         self.beginResetModel()
         self._fit_configurations = config_objects
+        self._rebuild_name_index()
         self.endResetModel()
         self.sigFitConfigurationsChanged.emit(self.configuration_names)
 
 
+class _FitWorkerSignals(QtCore.QObject):
+    """ Signals emitted by _FitWorker. QRunnable is not a QObject and can not emit signals itself.
+    """
+    # (request ID, fit_config name, fit key, ModelResult)
+    sigFitFinished = QtCore.Signal(int, str, object, object)
+
+
+class _FitWorker(QtCore.QRunnable):
+    """ QRunnable performing a single data fit (including parameter estimation) via
+    FitContainer._do_fit in a QThreadPool.
+    """
+
+    def __init__(self, request_id, fit_config, fit_key, fit_setup, x, data, high_res_x):
+        super().__init__()
+        self.signals = _FitWorkerSignals()
+        self._request_id = request_id
+        self._fit_config = fit_config
+        self._fit_key = fit_key
+        self._fit_setup = fit_setup
+        self._x = x
+        self._data = data
+        self._high_res_x = high_res_x
+
+    def run(self):
+        try:
+            result = FitContainer._do_fit(self._fit_setup, self._x, self._data, self._high_res_x)
+        except:
+            _log.exception(f'Exception while fitting data with fit config "{self._fit_config}":')
+            # Announce failed fit with result None
+            result = None
+        self.signals.sigFitFinished.emit(self._request_id, self._fit_config, self._fit_key, result)
+
+
 class FitContainer(QtCore.QObject):
     """
     """
@@ -299,6 +457,8 @@ class FitContainer(QtCore.QObject):
         self._configuration_model = config_model
         self._last_fit_result = None
         self._last_fit_config = 'No Fit'
+        self._fit_request_id = 0
+        self._last_fit_key = None
 
         self._configuration_model.sigFitConfigurationsChanged.connect(
             self.sigFitConfigurationsChanged
@@ -318,52 +478,182 @@ class FitContainer(QtCore.QObject):
             return self._last_fit_config, self._last_fit_result
 
     @QtCore.Slot(str, object, object)
-    def fit_data(self, fit_config, x, data):
-        with self._access_lock:
-            if fit_config:
-                # Handle "No Fit" case
-                if fit_config == 'No Fit':
-                    self._last_fit_result = None
-                    self._last_fit_config = 'No Fit'
-                else:
-                    config = self._configuration_model.get_configuration_by_name(fit_config)
-                    model = _fit_models[config.model]()
-                    estimator = config.estimator
-                    add_parameters = config.custom_parameters
-                    if estimator is None:
-                        parameters = model.make_params()
-                    else:
-                        parameters = model.estimators[estimator](data, x)
-                    if add_parameters is not None:
-                        for name, param in add_parameters.items():
-                            parameters[name] = param
-                    result = model.fit(data, parameters, x=x)
-                    # Mutate lmfit.ModelResult object to include high-resolution result curve
-                    high_res_x = np.linspace(x[0], x[-1], len(x) * 10)
-                    result.high_res_best_fit = (high_res_x,
-                                                model.eval(**result.best_values, x=high_res_x))
-                    self._last_fit_result = result
-                    self._last_fit_config = fit_config
+    def fit_data(self, fit_config, x, data, high_res_factor: int = 10):
+        """ Performs a fit of the given data using the fit configuration with name <fit_config>.
+        Blocks until the fit is done and returns the fit configuration name and the result.
+
+        If fit configuration and the contents of x and data are unchanged since the last fit, the
+        last fit result is returned without fitting again.
+
+        See also: FitContainer.fit_data_async
+        """
+        assert isinstance(high_res_factor, int) and high_res_factor > 0, \
+            'high_res_factor must be int > 0'
+        if fit_config:
+            # Handle "No Fit" case
+            if fit_config == 'No Fit':
+                fit_key = None
+                result = None
+            else:
+                # Hash and fit private copies. Callers may alter their buffers in-place.
+                x = self._as_fit_array(x)
+                data = self._as_fit_array(data)
+                fit_setup = self._get_fit_setup(fit_config)
+                fit_key = self._get_fit_key(fit_config, fit_setup, x, data, high_res_factor)
+                result = self._get_cached_fit(fit_key)
+                if result is None:
+                    high_res_x = self._get_high_res_x(x, high_res_factor)
+                    result = self._do_fit(fit_setup, x, data, high_res_x)
+            with self._access_lock:
+                # Supersede all pending asynchronous fits
+                self._fit_request_id += 1
+                self._last_fit_key = fit_key
+                self._last_fit_result = result
+                self._last_fit_config = fit_config
                 self.sigLastFitResultChanged.emit(self._last_fit_config, self._last_fit_result)
                 return self._last_fit_config, self._last_fit_result
-            return '', None
+        return '', None
+
+    @QtCore.Slot(str, object, object)
+    def fit_data_async(self, fit_config, x, data, high_res_factor: int = 10):
+        """ Non-blocking version of FitContainer.fit_data.
+        The fit is performed in the global QThreadPool and the result is announced via
+        sigLastFitResultChanged once it is finished. Only the result of the most recent fit request
+        is kept, results of superseded requests are discarded. If the fit fails, the exception is
+        logged and the result is announced as None.
+        """
+        assert isinstance(high_res_factor, int) and high_res_factor > 0, \
+            'high_res_factor must be int > 0'
+        if not fit_config:
+            return
+        if fit_config == 'No Fit':
+            fit_key = None
+            cached_result = None
+        else:
+            # Hash and fit private copies. Callers may alter their buffers in-place while the fit
+            # is still running.
+            x = self._as_fit_array(x)
+            data = self._as_fit_array(data)
+            fit_setup = self._get_fit_setup(fit_config)
+            fit_key = self._get_fit_key(fit_config, fit_setup, x, data, high_res_factor)
+            cached_result = self._get_cached_fit(fit_key)
+        with self._access_lock:
+            self._fit_request_id += 1
+            request_id = self._fit_request_id
+        if (fit_config == 'No Fit') or (cached_result is not None):
+            self._async_fit_finished(request_id, fit_config, fit_key, cached_result)
+            return
+        high_res_x = self._get_high_res_x(x, high_res_factor)
+        worker = _FitWorker(request_id, fit_config, fit_key, fit_setup, x, data, high_res_x)
+        worker.signals.sigFitFinished.connect(self._async_fit_finished)
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    @QtCore.Slot(int, str, object, object)
+    def _async_fit_finished(self, request_id, fit_config, fit_key, result):
+        with self._access_lock:
+            if request_id != self._fit_request_id:
+                return
+            # fit_key has been computed from exactly the arrays the result has been fitted to
+            self._last_fit_key = None if result is None else fit_key
+            self._last_fit_result = result
+            self._last_fit_config = fit_config
+            self.sigLastFitResultChanged.emit(self._last_fit_config, self._last_fit_result)
+
+    @staticmethod
+    def _as_fit_array(arr):
+        """ Converts arr once to a contiguous array of (at least) double precision as expected by
+        the scipy solvers. Complex data stays complex.
+        The returned array is always a new array not sharing memory with <arr>.
+        """
+        arr = np.asarray(arr)
+        dtype = np.result_type(arr.dtype, np.float64)
+        return np.array(arr, dtype=dtype, order='C', copy=True)
+
+    @staticmethod
+    def _get_fit_key(fit_config, fit_setup, x, data, high_res_factor):
+        """ Returns a key identifying a fit request by the fit configuration content and a digest of
+        the x and data array contents.
+        The key is only valid for the exact arrays that are fitted. Both fit_data and
+        fit_data_async therefore hash and fit private copies (see FitContainer._as_fit_array) so
+        callers may mutate their arrays in-place at any time.
+        """
+        model_name, estimator, custom_parameters = fit_setup
+        if custom_parameters is not None:
+            custom_parameters = tuple((name, p.value, p.min, p.max, p.vary) for name, p in
+                                      custom_parameters.items())
+        return (fit_config,
+                model_name,
+                estimator,
+                custom_parameters,
+                high_res_factor,
+                x.dtype.str,
+                x.shape,
+                hashlib.blake2b(x).digest(),
+                data.dtype.str,
+                data.shape,
+                hashlib.blake2b(data).digest())
+
+    def _get_cached_fit(self, fit_key):
+        """ Returns the last fit result if it has been created for <fit_key>, None otherwise.
+        """
+        with self._access_lock:
+            if (fit_key is not None) and (fit_key == self._last_fit_key):
+                return self._last_fit_result
+        return None
+
+    def _get_fit_setup(self, fit_config):
+        """ Returns fit model name, estimator name and custom parameters of the fit configuration
+        with name <fit_config>.
+        The returned custom parameters must not be mutated. They are replaced, not altered, upon
+        configuration changes and can therefore be handed to a worker thread.
+        """
+        config = self._configuration_model.get_configuration_by_name(fit_config)
+        return config.model, config.estimator, config._custom_parameters_shared
+
+    @staticmethod
+    def _get_high_res_x(x, high_res_factor):
+        """ Returns a new double precision high-resolution x grid spanning the range of <x>.
+        """
+        return np.linspace(x[0].real, x[-1].real, x.size * high_res_factor)
+
+    @staticmethod
+    def _do_fit(fit_setup, x, data, high_res_x):
+        """ Estimates the initial parameters, performs the actual fit and returns the resulting
+        lmfit.ModelResult.
+        Does not access any FitContainer state and can therefore run in any thread.
+        """
+        model_name, estimator, custom_parameters = fit_setup
+        model = _get_model(model_name)
+        if estimator is None:
+            parameters = _get_default_params(model_name)
+        else:
+            parameters = model.estimators[estimator](data, x)
+        if custom_parameters is not None:
+            for name, param in custom_parameters.items():
+                # Inserting a Parameter into Parameters mutates it, so insert a (cheap) copy.
+                parameters[name] = copy.copy(param)
+        result = model.fit(data, parameters, x=x)
+        # Mutate lmfit.ModelResult object to include high-resolution result curve
+        result.high_res_best_fit = (high_res_x, model.eval(**result.best_values, x=high_res_x))
+        return result
 
     @staticmethod
     def formatted_result(fit_result: Union[None, lmfit.model.ModelResult],
                          parameters_units: Optional[Mapping[str, str]] = None) -> str:
         if fit_result is None:
             return ''
-        if parameters_units is None:
-            parameters_units = dict()
+        # Missing units default to empty str
+        units = collections.defaultdict(str, () if parameters_units is None else parameters_units)
 
         parameters_to_format = dict()
         for name, param in fit_result.params.items():
-            stderr = param.stderr if param.vary else None
-            stderr = np.nan if param.vary and stderr is None else stderr
-
+            if param.vary:
+                stderr = np.nan if param.stderr is None else param.stderr
+            else:
+                stderr = None
             parameters_to_format[name] = {'value': param.value,
                                           'error': stderr,
-                                          'unit': parameters_units.get(name, '')}
+                                          'unit': units[name]}
 
         return create_formatted_output(parameters_to_format)
 
@@ -373,15 +663,24 @@ class FitContainer(QtCore.QObject):
                     export_keys: Optional[Iterable[str]] = ('value', 'stderr')) -> dict:
         if fit_result is None:
             return dict()
-        if parameters_units is None:
-            parameters_units = dict()
+        # Missing units default to empty str
+        units = collections.defaultdict(str, () if parameters_units is None else parameters_units)
+
+        export_keys = tuple(export_keys)
+        getter = operator.attrgetter(*export_keys) if export_keys else None
 
         fitparams = fit_result.result.params
         export_dict = {'model': fit_result.model.name}
 
-        for key, res in fitparams.items():
-            dict_i = {key: getattr(res, key) for key in export_keys}
-            dict_i['unit'] = parameters_units.get(key, '')
-            export_dict[key] = dict_i
+        for name, res in fitparams.items():
+            if getter is None:
+                dict_i = dict()
+            elif len(export_keys) == 1:
+                # operator.attrgetter returns a single value instead of a tuple for one attribute
+                dict_i = {export_keys[0]: getter(res)}
+            else:
+                dict_i = dict(zip(export_keys, getter(res)))
+            dict_i['unit'] = units[name]
+            export_dict[name] = dict_i
 
         return export_dict
@@ -92,7 +92,7 @@ class ExponentialDecay(FitModelBase):
             data_smoothed = data_smoothed - offset
 
         # Make sure there are no negative values
-        smooth_min = min(data_smoothed)
+        smooth_min = np.min(data_smoothed)
         if smooth_min <= 0:
             data_smoothed -= smooth_min
 
@@ -117,7 +117,7 @@ class ExponentialDecay(FitModelBase):
         else:
             estimate['amplitude'].set(value=amplitude, min=0)
         estimate['offset'].set(value=offset)
-        estimate['decay'].set(value=decay, min=2 * min(abs(np.ediff1d(x))))
+        estimate['decay'].set(value=decay, min=2 * np.min(np.abs(np.ediff1d(x))))
         estimate['stretch'].set(value=1, vary=False)
         return estimate
 
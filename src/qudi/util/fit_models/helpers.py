@@ -85,7 +85,7 @@ def find_highest_peaks(data, peak_count, allow_borders=True, **kwargs):
     assert len(data) >= 5, 'Data must contain at least 5 data points'
 
     # Return early if all elements are the same
-    if min(data) == max(data):
+    if np.min(data) == np.max(data):
         return list(), list(), list()
 
     # Find all peaks
@@ -118,7 +118,7 @@ def find_highest_peaks(data, peak_count, allow_borders=True, **kwargs):
             peak_heights[min_arg] = data[peaks[min_arg]]
         # Check if some peaks are missing and manually add borders if they look promising
         if len(peaks) < peak_count:
-            threshold = max(data) / 2
+            threshold = np.max(data) / 2
             no_left_peak = min(peaks) > 2 * width
             no_right_peak = max(peaks) < len(data) - 1 - 2 * width
             if no_left_peak and left_mean > threshold:
@@ -138,11 +138,11 @@ def estimate_double_peaks(data, x, minimum_distance=None):
     peak_indices, peak_heights, peak_widths = find_highest_peaks(data,
                                                                  peak_count=2,
                                                                  width=minimum_distance,
-                                                                 height=0.05 * max(data))
+                                                                 height=0.05 * np.max(data))
 
-    x_spacing = min(abs(np.ediff1d(x)))
+    x_spacing = np.min(np.abs(np.ediff1d(x)))
     x_span = abs(x[-1] - x[0])
-    data_span = abs(max(data) - min(data))
+    data_span = abs(np.max(data) - np.min(data))
 
     # Replace missing peaks with sensible default value
     if len(peak_indices) == 1:
@@ -163,7 +163,7 @@ def estimate_double_peaks(data, x, minimum_distance=None):
                 'center': np.asarray(x[np.asarray(peak_indices)])}
     limits = {'height': ((0, 2 * data_span),) * 2,
               'fwhm'  : ((x_spacing, x_span),) * 2,
-              'center': ((min(x) - x_span / 2, max(x) + x_span / 2),) * 2}
+              'center': ((np.min(x) - x_span / 2, np.max(x) + x_span / 2),) * 2}
     return estimate, limits
 
 
@@ -172,11 +172,11 @@ def estimate_triple_peaks(data, x, minimum_distance=None):
     peak_indices, peak_heights, peak_widths = find_highest_peaks(data,
                                                                  peak_count=3,
                                                                  width=minimum_distance,
-                                                                 height=0.05 * max(data))
+                                                                 height=0.05 * np.max(data))
 
-    x_spacing = min(abs(np.ediff1d(x)))
+    x_spacing = np.min(np.abs(np.ediff1d(x)))
     x_span = abs(x[-1] - x[0])
-    data_span = abs(max(data) - min(data))
+    data_span = abs(np.max(data) - np.min(data))
 
     # Replace missing peaks with sensible default value
     if len(peak_indices) == 2:
@@ -206,5 +206,5 @@ def estimate_triple_peaks(data, x, minimum_distance=None):
                 'center': np.asarray(x[np.asarray(peak_indices)])}
     limits = {'height': ((0, 2 * data_span),) * 3,
               'fwhm'  : ((x_spacing, x_span),) * 3,
-              'center': ((min(x) - x_span / 2, max(x) + x_span / 2),) * 3}
+              'center': ((np.min(x) - x_span / 2, np.max(x) + x_span / 2),) * 3}
     return estimate, limits
@@ -49,7 +49,7 @@ class Linear(FitModelBase):
         slope = a_1 / a_2
         intercept = data_mean - slope * x_mean
 
-        max_slope = (max(data) - min(data)) / abs(x[-1] - x[0])  # maximum slope possible
+        max_slope = (np.max(data) - np.min(data)) / abs(x[-1] - x[0])  # maximum slope possible
 
         estimate = self.make_params()
         estimate['offset'].set(value=intercept, min=-np.inf, max=np.inf)
@@ -66,5 +66,5 @@ class Linear(FitModelBase):
     def estimate_no_offset(self, data, x):
         estimate = self.make_params()
         estimate['slope'].set(value=0, min=-np.inf, max=np.inf, vary=False)
-        estimate['offset'].set(value=np.mean(data), min=min(data), max=max(data))
+        estimate['offset'].set(value=np.mean(data), min=np.min(data), max=np.max(data))
         return estimate
@@ -102,23 +102,23 @@ class Lorentzian(FitModelBase):
         center = x[np.argmax(data_smoothed)]
 
         # calculate amplitude
-        amplitude = abs(max(data_smoothed))
+        amplitude = abs(np.max(data_smoothed))
 
         # according to the derived formula, calculate sigma. The crucial part is here that the
         # offset was estimated correctly, then the area under the curve is calculated correctly:
         numerical_integral = np.trapz(data_smoothed, x)
         sigma = abs(numerical_integral / (np.pi * amplitude))
 
-        x_spacing = min(abs(np.ediff1d(x)))
+        x_spacing = np.min(np.abs(np.ediff1d(x)))
         x_span = abs(x[-1] - x[0])
-        data_span = abs(max(data) - min(data))
+        data_span = abs(np.max(data) - np.min(data))
 
         estimate = self.make_params()
         estimate['amplitude'].set(value=amplitude, min=0, max=2 * amplitude)
         estimate['sigma'].set(value=sigma, min=x_spacing, max=x_span)
-        estimate['center'].set(value=center, min=min(x) - x_span / 2, max=max(x) + x_span / 2)
+        estimate['center'].set(value=center, min=np.min(x) - x_span / 2, max=np.max(x) + x_span / 2)
         estimate['offset'].set(
-            value=offset, min=min(data) - data_span / 2, max=max(data) + data_span / 2
+            value=offset, min=np.min(data) - data_span / 2, max=np.max(data) + data_span / 2
         )
         return estimate
 
@@ -303,13 +303,13 @@ class LorentzianLinear(FitModelBase):
 
     @staticmethod
     def _model_function(x, offset, slope, center, sigma, amplitude):
-        x0 = (x - min(x))
+        x0 = (x - np.min(x))
         return offset + x0 * slope + multiple_lorentzian(x, (center,), (sigma,), (amplitude,))
 
     @estimator('Peak')
     def estimate_peak(self, data, x):
         data, x = sort_check_data(data, x)
-        data_span = abs(max(data) - min(data))
+        data_span = abs(np.max(data) - np.min(data))
 
         # Perform a normal Lorentzian peak fit and subtract the result from data
         model = Lorentzian()
@@ -318,13 +318,13 @@ class LorentzianLinear(FitModelBase):
         # Perform a linear fit in subtracted data in order to estimate slope
         model = Linear()
         linear_fit = model.fit(data_sub, model.estimate(data_sub, x), x=x)
-        offset = linear_fit.params['offset'].value + min(x) * linear_fit.params['slope'].value
+        offset = linear_fit.params['offset'].value + np.min(x) * linear_fit.params['slope'].value
 
         # Merge fit results into parameter estimates
         estimate = self.make_params()
         estimate['offset'].set(value=offset,
-                               min=min(data) - data_span / 2,
-                               max=max(data) + data_span / 2,
+                               min=np.min(data) - data_span / 2,
+                               max=np.max(data) + data_span / 2,
                                vary=True)
         estimate['slope'].set(value=linear_fit.params['slope'].value, min=-np.inf, max=np.inf, vary=True)
         estimate['amplitude'].set(value=gauss_fit.params['amplitude'].value,
@@ -59,7 +59,7 @@ def multiple_poissonian(x, mus, amplitudes):
     # large values of mu, we define a cut-off value of 1e6. If our independent variables x are at
     # or above this value, we will switch to calculating a normal distribution. This ensures that
     # this function will remain numerically stable for very large values of x and mu.
-    if min(x) < 1e6:
+    if np.min(x) < 1e6:
         return sum(np.exp(xlogy(x, mu) - gammaln(x + 1) - mu) for mu, amp in
                    zip(mus, amplitudes, amplitudes))
     else:
@@ -86,25 +86,25 @@ class Poissonian(FitModelBase):
         data_smoothed, _ = smooth_data(data, filter_width)
 
         # estimate offset and level data
-        offset = min(data_smoothed)
+        offset = np.min(data_smoothed)
         data_smoothed -= offset
 
         # estimate other parameters
         mu = x[np.argmax(data_smoothed)]
-        amplitude = max(data_smoothed) / self._model_function(mu, 0, mu, 1)
+        amplitude = np.max(data_smoothed) / self._model_function(mu, 0, mu, 1)
 
-        x_spacing = min(abs(np.ediff1d(x)))
+        x_spacing = np.min(np.abs(np.ediff1d(x)))
         x_span = abs(x[-1] - x[0])
-        data_span = abs(max(data) - min(data))
+        data_span = abs(np.max(data) - np.min(data))
 
         estimate = self.make_params()
         estimate['mu'].set(value=mu,
-                           min=max(x_spacing, min(x) - x_span / 2),
-                           max=min(x_span, max(x) + x_span / 2))
+                           min=max(x_spacing, np.min(x) - x_span / 2),
+                           max=min(x_span, np.max(x) + x_span / 2))
         estimate['amplitude'].set(value=amplitude, min=0, max=2 * amplitude)
         estimate['offset'].set(value=offset,
-                               min=min(data) - data_span / 2,
-                               max=max(data) + data_span / 2)
+                               min=np.min(data) - data_span / 2,
+                               max=np.max(data) + data_span / 2)
         return estimate
 
     @estimator('No Offset')
@@ -134,7 +134,7 @@ class DoublePoissonian(FitModelBase):
         data, x = sort_check_data(data, x)
         data_smoothed, filter_width = smooth_data(data)
         # estimate offset and level data
-        offset = min(data_smoothed)
+        offset = np.min(data_smoothed)
         data_smoothed -= offset
 
         estimate, limits = estimate_double_peaks(data_smoothed, x, filter_width)
@@ -52,21 +52,21 @@ class Sine(FitModelBase):
     @estimator('default')
     def estimate(self, data, x):
         data, x = sort_check_data(data, x)
-        x_span = abs(max(x) - min(x))
+        x_span = abs(np.max(x) - np.min(x))
         offset = np.mean(data)
 
         estimate = self.estimate_no_offset(data - offset, x)
         if 1/(2 * estimate['frequency'].value) > x_span:
             estimate['offset'].set(value=offset, min=-np.inf, max=np.inf, vary=True)
         else:
-            estimate['offset'].set(value=offset, min=min(data), max=max(data), vary=True)
+            estimate['offset'].set(value=offset, min=np.min(data), max=np.max(data), vary=True)
         return estimate
 
     @estimator('No Offset')
     def estimate_no_offset(self, data, x):
         data, x = sort_check_data(data, x)
-        x_step = min(abs(np.ediff1d(x)))
-        data_span = abs(max(data) - min(data))
+        x_step = np.min(np.abs(np.ediff1d(x)))
+        data_span = abs(np.max(data) - np.min(data))
         amplitude = data_span / 2
 
         frequency, _ = estimate_frequency_ft(data, x)
@@ -93,9 +93,9 @@ class Sine(FitModelBase):
     @estimator('Zero Phase')
     def estimate_zero_phase(self, data, x):
         data, x = sort_check_data(data, x)
-        x_step = min(abs(np.ediff1d(x)))
-        x_span = abs(max(x) - min(x))
-        data_span = abs(max(data) - min(data))
+        x_step = np.min(np.abs(np.ediff1d(x)))
+        x_span = abs(np.max(x) - np.min(x))
+        data_span = abs(np.max(data) - np.min(data))
 
         amplitude = data_span / 2
         offset = np.mean(data)
@@ -107,7 +107,7 @@ class Sine(FitModelBase):
         if 1/(2 * frequency) > x_span:
             estimate['offset'].set(value=offset, min=-np.inf, max=np.inf, vary=True)
         else:
-            estimate['offset'].set(value=offset, min=min(data), max=max(data), vary=True)
+            estimate['offset'].set(value=offset, min=np.min(data), max=np.max(data), vary=True)
         estimate['phase'].set(value=0, min=-np.pi, max=np.pi, vary=False)
         return estimate
 
@@ -134,14 +134,14 @@ class DoubleSine(FitModelBase):
 
     @estimator('default')
     def estimate(self, data, x):
-        x_span = abs(max(x) - min(x))
+        x_span = abs(np.max(x) - np.min(x))
         offset = np.mean(data)
 
         estimate = self.estimate_no_offset(data - offset, x)
         if 1 / (2 * min(estimate['frequency_1'].value, estimate['frequency_2'].value)) > x_span:
             estimate['offset'].set(value=offset, min=-np.inf, max=np.inf, vary=True)
         else:
-            estimate['offset'].set(value=offset, min=min(data), max=max(data), vary=True)
+            estimate['offset'].set(value=offset, min=np.min(data), max=np.max(data), vary=True)
         return estimate
 
     @estimator('No Offset')
@@ -206,14 +206,14 @@ class ExponentialDecaySine(FitModelBase):
 
     @estimator('Decay')
     def estimate_decay(self, data, x):
-        x_span = abs(max(x) - min(x))
+        x_span = abs(np.max(x) - np.min(x))
         offset = np.mean(data)
 
         estimate = self.estimate_decay_no_offset(data - offset, x)
         if 1 / (2 * estimate['frequency'].value) > x_span:
             estimate['offset'].set(value=offset, min=-np.inf, max=np.inf, vary=True)
         else:
-            estimate['offset'].set(value=offset, min=min(data), max=max(data), vary=True)
+            estimate['offset'].set(value=offset, min=np.min(data), max=np.max(data), vary=True)
         return estimate
 
     @estimator('Stretched Decay')
@@ -226,8 +226,8 @@ class ExponentialDecaySine(FitModelBase):
     @estimator('Decay (no offset)')
     def estimate_decay_no_offset(self, data, x):
         data, x = sort_check_data(data, x)
-        x_step = min(abs(np.ediff1d(x)))
-        data_span = abs(max(data) - min(data))
+        x_step = np.min(np.abs(np.ediff1d(x)))
+        data_span = abs(np.max(data) - np.min(data))
         amplitude = data_span / 2
 
         frequency, (dft_x, dft_y) = estimate_frequency_ft(data, x)
@@ -235,7 +235,7 @@ class ExponentialDecaySine(FitModelBase):
         # remove noise for peak width and decay constant estimation
         dft_y[np.argwhere(dft_y <= np.std(dft_y))] = 0
         # calculating the width of the FT peak for the estimation of decay constant
-        decay = 1 / (2 * np.trapz(dft_y, dft_x) / max(dft_y))
+        decay = 1 / (2 * np.trapz(dft_y, dft_x) / np.max(dft_y))
         # s = 0
         # for i in range(0, len(dft_x)):
         #     s += dft_y[i] * abs(dft_x[1] - dft_x[0]) / max(dft_y)
@@ -297,14 +297,14 @@ class ExponentialDecayDoubleSine(FitModelBase):
 
     @estimator('Decay')
     def estimate_decay(self, data, x):
-        x_span = abs(max(x) - min(x))
+        x_span = abs(np.max(x) - np.min(x))
         offset = np.mean(data)
 
         estimate = self.estimate_decay_no_offset(data - offset, x)
         if 1 / (2 * min(estimate['frequency_1'].value, estimate['frequency_2'].value)) > x_span:
             estimate['offset'].set(value=offset, min=-np.inf, max=np.inf, vary=True)
         else:
-            estimate['offset'].set(value=offset, min=min(data), max=max(data), vary=True)
+            estimate['offset'].set(value=offset, min=np.min(data), max=np.max(data), vary=True)
         return estimate
 
     @estimator('Stretched Decay')
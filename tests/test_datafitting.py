@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+"""
+This file contains unit tests for the fit result caching and asynchronous fitting in
+qudi.util.datafitting.FitContainer.
+
+Copyright (c) 2021, the qudi developers. See the AUTHORS.md file at the top-level directory of this
+distribution and on <https://github.com/Ulm-IQO/qudi-core/>
+
+This file is part of qudi.
+
+Qudi is free software: you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation,
+either version 3 of the License, or (at your option) any later version.
+
+Qudi is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with qudi.
+If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+import numpy as np
+from PySide2 import QtCore
+
+from qudi.util.datafitting import FitConfigurationsModel, FitContainer
+
+
+class TestFitContainerCache(unittest.TestCase):
+
+    @staticmethod
+    def gaussian(x, offset, amplitude, center, sigma):
+        return offset + amplitude * np.exp(-((x - center) ** 2) / (2 * sigma ** 2))
+
+    @classmethod
+    def setUpClass(cls):
+        cls._app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+    def setUp(self):
+        self.config_model = FitConfigurationsModel()
+        self.config_model.add_configuration('gauss', 'Gaussian', 'Peak')
+        self.container = FitContainer(config_model=self.config_model)
+        self.x_values = np.linspace(0, 10, 101)
+        noise = np.random.default_rng(42).normal(0, 0.01, self.x_values.size)
+        self.y_values = noise + self.gaussian(self.x_values, 1, 3, 4, 1)
+
+    def test_unchanged_fit_is_cached(self):
+        _, result = self.container.fit_data('gauss', self.x_values, self.y_values)
+        _, cached_result = self.container.fit_data('gauss', self.x_values, self.y_values.copy())
+        self.assertIs(cached_result, result)
+        self.assertIs(self.container.last_fit[1], result)
+
+    def test_in_place_data_change_refits(self):
+        _, result = self.container.fit_data('gauss', self.x_values, self.y_values)
+        self.y_values[:] = self.gaussian(self.x_values, 1, 3, 6, 1)
+        _, new_result = self.container.fit_data('gauss', self.x_values, self.y_values)
+        self.assertIsNot(new_result, result)
+        self.assertAlmostEqual(result.best_values['center'], 4, delta=0.1)
+        self.assertAlmostEqual(new_result.best_values['center'], 6, delta=0.1)
+
+    def test_estimator_change_refits(self):
+        _, result = self.container.fit_data('gauss', self.x_values, self.y_values)
+        index = self.config_model.index(0, 0)
+        self.assertTrue(self.config_model.setData(index, ('Dip', dict())))
+        _, new_result = self.container.fit_data('gauss', self.x_values, self.y_values)
+        self.assertIsNot(new_result, result)
+
+    def test_custom_parameters_change_refits(self):
+        _, result = self.container.fit_data('gauss', self.x_values, self.y_values)
+        index = self.config_model.index(0, 0)
+        self.assertTrue(
+            self.config_model.setData(index, ('Peak', {'offset': (False, 1.5, -np.inf, np.inf)}))
+        )
+        _, new_result = self.container.fit_data('gauss', self.x_values, self.y_values)
+        self.assertIsNot(new_result, result)
+        self.assertEqual(new_result.best_values['offset'], 1.5)
+        # Unchanged custom parameters must hit the cache again
+        _, cached_result = self.container.fit_data('gauss', self.x_values, self.y_values)
+        self.assertIs(cached_result, new_result)
+
+
+class TestFitContainerAsync(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls._app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+    def setUp(self):
+        self.config_model = FitConfigurationsModel()
+        self.config_model.add_configuration('gauss', 'Gaussian', 'Peak')
+        self.container = FitContainer(config_model=self.config_model)
+        self.emitted = list()
+        self.container.sigLastFitResultChanged.connect(self._result_changed)
+        self.x_values = np.linspace(0, 10, 101)
+
+    def tearDown(self):
+        self.container.sigLastFitResultChanged.disconnect(self._result_changed)
+
+    def _result_changed(self, fit_config, result):
+        self.emitted.append((fit_config, result))
+
+    def _wait_for_fits(self):
+        self.assertTrue(QtCore.QThreadPool.globalInstance().waitForDone(30000))
+        self._app.processEvents()
+
+    def test_superseded_request_is_discarded(self):
+        centers = (3, 5, 7)
+        y_values = np.empty_like(self.x_values)
+        for center in centers:
+            # Reuse the same buffer to check that the workers fit private copies
+            y_values[:] = TestFitContainerCache.gaussian(self.x_values, 1, 3, center, 1)
+            self.container.fit_data_async('gauss', self.x_values, y_values)
+        self._wait_for_fits()
+        self.assertEqual(len(self.emitted), 1)
+        fit_config, result = self.emitted[0]
+        self.assertEqual(fit_config, 'gauss')
+        self.assertAlmostEqual(result.best_values['center'], centers[-1], delta=0.1)
+        self.assertEqual(self.container.last_fit, (fit_config, result))
+
+    def test_sync_fit_supersedes_pending_request(self):
+        y_values = TestFitContainerCache.gaussian(self.x_values, 1, 3, 3, 1)
+        self.container.fit_data_async('gauss', self.x_values, y_values)
+        _, result = self.container.fit_data('No Fit', self.x_values, y_values)
+        self.assertIsNone(result)
+        self._wait_for_fits()
+        self.assertEqual(self.emitted, [('No Fit', None)])
+        self.assertEqual(self.container.last_fit, ('No Fit', None))
+
+
+if __name__ == '__main__':
+    unittest.main()